@@ -1,15 +1,44 @@
 import sys
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QLabel, QLineEdit, QPushButton, 
-                            QTableWidget, QTableWidgetItem)
-from PyQt5.QtGui import QFont, QPalette, QColor
-from PyQt5.QtCore import Qt
+                            QTableView, QHeaderView)
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
 import sqlite3
 import random
 from datetime import datetime
-from typing import Dict, List
+
+_TITLES: tuple[str, ...] = (
+    "The Art of Programming", "Digital Fortress", "The Silent Patient",
+    "The Midnight Library", "Atomic Habits", "Deep Learning Basics",
+    "Python Mastery", "Data Science 101", "Web Development Guide",
+    "Artificial Intelligence"
+)
+
+_AUTHORS: tuple[str, ...] = (
+    "John Smith", "Emma Wilson", "Michael Brown", "Sarah Davis",
+    "James Johnson", "Robert Martin", "David Miller", "Lisa Anderson"
+)
+
+_GENRES: tuple[str, ...] = (
+    "Programming", "Technology", "Computer Science", "Software Development",
+    "Data Science", "Web Development", "Artificial Intelligence"
+)
 
 class DatabaseManager:
+    __slots__ = ('db_name', 'conn', 'cursor')
+
+    INSERT_BOOK_SQL = 'INSERT INTO books VALUES (?, ?, ?, ?, ?)'
+    INSERT_SAMPLE_SQL = 'INSERT OR IGNORE INTO books VALUES (?, ?, ?, ?, ?)'
+    SELECT_PAGE_SQL = 'SELECT * FROM books ORDER BY rowid LIMIT ? OFFSET ?'
+    COUNT_SQL = 'SELECT COUNT(*) FROM books'
+    SEARCH_WHERE = '''WHERE lower(title || ' ' || author || ' ' || isbn || ' ' ||
+                                 ifnull(genre, '') || ' ' || ifnull(pub_year, ''))
+                     LIKE ? ESCAPE '\\' '''
+    SEARCH_PAGE_SQL = ('SELECT * FROM books ' + SEARCH_WHERE +
+                       'ORDER BY rowid LIMIT ? OFFSET ?')
+    SEARCH_COUNT_SQL = 'SELECT COUNT(*) FROM books ' + SEARCH_WHERE
+    DELETE_BOOK_SQL = 'DELETE FROM books WHERE isbn = ?'
+
     def __init__(self, db_name: str = 'library.db'):
         self.db_name = db_name
         self.conn = None
@@ -18,7 +47,14 @@ class DatabaseManager:
         self.create_tables()
 
     def connect(self) -> None:
-        self.conn = sqlite3.connect(self.db_name)
+        self.conn = sqlite3.connect(self.db_name, cached_statements=256)
+        self.conn.row_factory = None
+        self.conn.isolation_level = 'DEFERRED'
+        self.conn.execute('PRAGMA cache_size=-20000')
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self.conn.execute('PRAGMA mmap_size=268435456')
         self.cursor = self.conn.cursor()
 
     def create_tables(self) -> None:
@@ -31,67 +67,162 @@ class DatabaseManager:
                 pub_year TEXT
             )
         ''')
+        self.cursor.execute(
+            'CREATE INDEX IF NOT EXISTS idx_books_title ON books(title COLLATE NOCASE)'
+        )
+        self.cursor.execute(
+            'CREATE INDEX IF NOT EXISTS idx_books_author ON books(author COLLATE NOCASE)'
+        )
         self.conn.commit()
 
     def add_book(self, book_data: tuple) -> bool:
         try:
-            self.cursor.execute(
-                'INSERT INTO books VALUES (?, ?, ?, ?, ?)',
-                book_data
-            )
-            self.conn.commit()
+            with self.conn:
+                self.cursor.execute(self.INSERT_BOOK_SQL, book_data)
             return True
         except sqlite3.Error:
             return False
 
-    def get_all_books(self) -> List[tuple]:
-        self.cursor.execute('SELECT * FROM books')
+    def get_books(self, limit: int, offset: int) -> list[tuple]:
+        self.cursor.execute(self.SELECT_PAGE_SQL, (limit, offset))
+        return self.cursor.fetchall()
+
+    def count_books(self) -> int:
+        self.cursor.execute(self.COUNT_SQL)
+        return self.cursor.fetchone()[0]
+
+    def search_books(self, query: str, limit: int, offset: int) -> list[tuple]:
+        self.cursor.execute(
+            self.SEARCH_PAGE_SQL, (self._like_pattern(query), limit, offset)
+        )
         return self.cursor.fetchall()
 
+    def count_search_results(self, query: str) -> int:
+        self.cursor.execute(self.SEARCH_COUNT_SQL, (self._like_pattern(query),))
+        return self.cursor.fetchone()[0]
+
+    @staticmethod
+    def _like_pattern(query: str) -> str:
+        escaped = (query.lower().replace('\\', '\\\\')
+                   .replace('%', '\\%').replace('_', '\\_'))
+        return f"%{escaped}%"
+
     def delete_book(self, isbn: str) -> bool:
         try:
-            self.cursor.execute('DELETE FROM books WHERE isbn = ?', (isbn,))
-            self.conn.commit()
+            with self.conn:
+                self.cursor.execute(self.DELETE_BOOK_SQL, (isbn,))
             return True
         except sqlite3.Error:
             return False
 
-    def add_sample_books(self) -> None:
-        sample_data = self._generate_sample_data()
-        self.cursor.executemany('INSERT INTO books VALUES (?, ?, ?, ?, ?)', sample_data)
-        self.conn.commit()
-
-    def _generate_sample_data(self) -> List[tuple]:
-        titles = [
-            "The Art of Programming", "Digital Fortress", "The Silent Patient",
-            "The Midnight Library", "Atomic Habits", "Deep Learning Basics",
-            "Python Mastery", "Data Science 101", "Web Development Guide",
-            "Artificial Intelligence"
-        ]
-        
-        authors = [
-            "John Smith", "Emma Wilson", "Michael Brown", "Sarah Davis",
-            "James Johnson", "Robert Martin", "David Miller", "Lisa Anderson"
-        ]
-        
-        genres = [
-            "Programming", "Technology", "Computer Science", "Software Development",
-            "Data Science", "Web Development", "Artificial Intelligence"
-        ]
+    def add_sample_books(self, count: int = 50) -> bool:
+        sample_data = self._generate_sample_data(count)
+        try:
+            with self.conn:
+                self.cursor.executemany(self.INSERT_SAMPLE_SQL, sample_data)
+            return True
+        except sqlite3.Error:
+            return False
 
-        books = []
+    def _generate_sample_data(self, count: int = 50) -> list[tuple]:
         current_year = datetime.now().year
-        
-        for _ in range(50):
-            title = f"{random.choice(titles)} {random.randint(1, 5)}"
-            author = random.choice(authors)
-            isbn = ''.join([str(random.randint(0, 9)) for _ in range(10)])
-            genre = random.choice(genres)
-            pub_year = str(random.randint(current_year - 20, current_year))
-            
-            books.append((title, author, isbn, genre, pub_year))
-        
-        return books
+
+        titles_s = random.choices(_TITLES, k=count)
+        nums = random.choices(range(1, 6), k=count)
+        authors_s = random.choices(_AUTHORS, k=count)
+        genres_s = random.choices(_GENRES, k=count)
+        year_strs = [str(year) for year in range(current_year - 20, current_year + 1)]
+        years = random.choices(year_strs, k=count)
+        isbns = [f"{random.randrange(10**10):010d}" for _ in range(count)]
+
+        return list(zip(
+            (f"{title} {num}" for title, num in zip(titles_s, nums)),
+            authors_s, isbns, genres_s, years
+        ))
+
+class BooksModel(QAbstractTableModel):
+    HEADERS = ["Title", "Author", "ISBN", "Genre", "Publication Year"]
+    PAGE_SIZE = 200
+
+    def __init__(self, db: DatabaseManager, parent=None):
+        super().__init__(parent)
+        self._db = db
+        self._rows: list[tuple] = []
+        self._total = 0
+        self._search = ''
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return 5
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+    def isbn_at(self, row: int) -> str:
+        return self._rows[row][2]
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return len(self._rows) < self._total
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        start = len(self._rows)
+        books = self._fetch_page(start)
+        if not books:
+            self._total = start
+            return
+        self.beginInsertRows(QModelIndex(), start, start + len(books) - 1)
+        self._rows.extend(books)
+        self.endInsertRows()
+
+    def reload(self, search_text: str = '') -> None:
+        self.beginResetModel()
+        self._search = search_text
+        if search_text:
+            self._total = self._db.count_search_results(search_text)
+        else:
+            self._total = self._db.count_books()
+        self._rows = self._fetch_page(0)
+        self.endResetModel()
+
+    def _fetch_page(self, offset: int) -> list[tuple]:
+        if self._search:
+            return self._db.search_books(self._search, self.PAGE_SIZE, offset)
+        return self._db.get_books(self.PAGE_SIZE, offset)
+
+    def append_row(self, book: tuple) -> None:
+        self._total += 1
+        row = len(self._rows)
+        if row < self._total - 1:
+            return
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(book)
+        self.endInsertRows()
+
+    def remove_row(self, row: int) -> None:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._total -= 1
+        self.endRemoveRows()
 
 class LibraryManagementSystem(QMainWindow):
     def __init__(self):
@@ -132,14 +263,14 @@ class LibraryManagementSystem(QMainWindow):
             QPushButton:pressed {
                 background-color: #0a3d91;
             }
-            QTableWidget {
+            QTableView {
                 background-color: #2d2d2d;
                 color: white;
                 gridline-color: #3d3d3d;
                 border: 1px solid #3d3d3d;
                 border-radius: 3px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
             QHeaderView::section {
@@ -191,22 +322,30 @@ class LibraryManagementSystem(QMainWindow):
         layout.addWidget(banner)
 
     def _setup_input_fields(self, layout: QVBoxLayout) -> None:
-        self.inputs = {}
-        fields = ['Title:', 'Author:', 'ISBN:', 'Genre:', 'Pub. Year:']
+        self.title_edit = QLineEdit()
+        self.author_edit = QLineEdit()
+        self.isbn_edit = QLineEdit()
+        self.genre_edit = QLineEdit()
+        self.pub_year_edit = QLineEdit()
+        fields = (
+            ('Title:', self.title_edit),
+            ('Author:', self.author_edit),
+            ('ISBN:', self.isbn_edit),
+            ('Genre:', self.genre_edit),
+            ('Pub. Year:', self.pub_year_edit),
+        )
         
         input_widget = QWidget()
         input_layout = QVBoxLayout()
         input_widget.setLayout(input_layout)
         
-        for field in fields:
+        for field, line_edit in fields:
             h_layout = QHBoxLayout()
             label = QLabel(field)
             label.setMinimumWidth(80)
-            line_edit = QLineEdit()
             h_layout.addWidget(label)
             h_layout.addWidget(line_edit)
             input_layout.addLayout(h_layout)
-            self.inputs[field] = line_edit
         
         layout.addWidget(input_widget)
 
@@ -233,19 +372,25 @@ class LibraryManagementSystem(QMainWindow):
         search_label.setMinimumWidth(80)
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search books...")
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._do_search)
         self.search_input.textChanged.connect(self.search_books)
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.search_input)
         layout.addLayout(search_layout)
 
     def _setup_table(self, layout: QVBoxLayout) -> None:
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(
-            ["Title", "Author", "ISBN", "Genre", "Publication Year"]
-        )
+        self.model = BooksModel(self.db, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setAlternatingRowColors(True)
         self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(
+            self.table.fontMetrics().height() + 12
+        )
         self.table.setShowGrid(True)
         layout.addWidget(self.table)
 
@@ -256,49 +401,46 @@ class LibraryManagementSystem(QMainWindow):
 
     def add_book(self) -> None:
         book_data = (
-            self.inputs['Title:'].text(),
-            self.inputs['Author:'].text(),
-            self.inputs['ISBN:'].text(),
-            self.inputs['Genre:'].text(),
-            self.inputs['Pub. Year:'].text()
+            self.title_edit.text(),
+            self.author_edit.text(),
+            self.isbn_edit.text(),
+            self.genre_edit.text(),
+            self.pub_year_edit.text()
         )
         
         if self.db.add_book(book_data):
-            self.load_books()
+            if self.search_input.text():
+                self.load_books()
+            else:
+                self.model.append_row(book_data)
             self.clear_fields()
 
     def clear_fields(self) -> None:
-        for input_field in self.inputs.values():
-            input_field.clear()
+        self.title_edit.clear()
+        self.author_edit.clear()
+        self.isbn_edit.clear()
+        self.genre_edit.clear()
+        self.pub_year_edit.clear()
 
     def load_books(self) -> None:
-        books = self.db.get_all_books()
-        self.table.setRowCount(len(books))
-        for row, book in enumerate(books):
-            for col, value in enumerate(book):
-                self.table.setItem(row, col, QTableWidgetItem(str(value)))
+        self.model.reload(self.search_input.text())
 
     def search_books(self) -> None:
-        search_text = self.search_input.text().lower()
-        for row in range(self.table.rowCount()):
-            match = False
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item and search_text in item.text().lower():
-                    match = True
-                    break
-            self.table.setRowHidden(row, not match)
+        self._search_timer.start()
+
+    def _do_search(self) -> None:
+        self.load_books()
 
     def delete_book(self) -> None:
-        current_row = self.table.currentRow()
+        current_row = self.table.currentIndex().row()
         if current_row >= 0:
-            isbn = self.table.item(current_row, 2).text()
+            isbn = self.model.isbn_at(current_row)
             if self.db.delete_book(isbn):
-                self.load_books()
+                self.model.remove_row(current_row)
 
     def add_sample_books(self) -> None:
-        self.db.add_sample_books()
-        self.load_books()
+        if self.db.add_sample_books():
+            self.load_books()
 
 def main():
     app = QApplication(sys.argv)